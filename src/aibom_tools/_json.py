@@ -0,0 +1,32 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the standard library
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import json
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes or text"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes, or indented by two spaces if requested"""
+    if orjson is not None:
+        # Non-string keys are coerced to strings, matching the standard library
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -3,16 +3,23 @@ from typing import Optional
 import requests
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.util.retry import Retry
 
+from . import _json
 from .config import Config
 
 console = Console()
 
+# Default connection pool size; scans size it to their concurrency so workers reuse keep-alive connections
+POOL_SIZE = 32
+
 class SnykAIBomAPIClient:
     """Snyk AI-BOM scanner client."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, pool_size: int = POOL_SIZE):
         self.api_url = config.api_url
         self.org_id = config.org_id
         self.group_id = config.group_id
@@ -21,10 +28,30 @@ class SnykAIBomAPIClient:
             'Content-Type': 'application/vnd.api+json',
             'Authorization': f'token {config.api_token}'
         }
+        self.session = self._create_session(pool_size)
+    
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        Creates a session with a pooled, retrying HTTPS adapter so repeated API calls
+        reuse connections instead of paying a TCP + TLS handshake each time.
+        """
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Closes the session, releasing its pooled connections."""
+        self.session.close()
     
-    def get_all_targets(self):
+    def get_all_targets(self, concurrency: int = 1):
         """
         Fetches all targets from a list of Snyk organizations, handling pagination.
+        
+        Target pages are cursor-paginated, so each organization's pages are fetched in order,
+        but up to `concurrency` organizations are fetched at the same time.
         """
         orgs = []
         if self.group_id:
@@ -33,8 +60,9 @@ class SnykAIBomAPIClient:
             orgs.append({'id': self.org_id})
 
         targets = []
-        for org in orgs:
-            targets.extend(self.get_all_targets_from_org(org))
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(orgs)))) as executor:
+            for org_targets in executor.map(self.get_all_targets_from_org, orgs):
+                targets.extend(org_targets)
         
         return targets
 
@@ -45,11 +73,11 @@ class SnykAIBomAPIClient:
         orgs = []
         url = f"{self.api_url}/rest/groups/{self.group_id}/orgs?version={self.api_version}&limit=100"
         while url:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
-            data = response.json()
+            data = _json.loads(response.content)
             orgs.extend(data.get('data', []))
-            url = data.get('links', {}).get('next')
+            url = (data.get('links') or {}).get('next')
         return orgs
         
     def get_all_targets_from_org(self, org: Optional[dict]):
@@ -69,21 +97,21 @@ class SnykAIBomAPIClient:
         # Loop as long as there is a "next" page URL
         while url:
             try:
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url, headers=self.headers)
                 response.raise_for_status() # Exit if there's an error
-                data = response.json()
+                data = _json.loads(response.content)
                 
                 # Add the targets from the current page to our list
                 targets.extend(data.get('data', []))
                 
                 # Get the URL for the next page. If it doesn't exist, the loop will end.
-                next_link = data.get('links', {}).get('next')
+                next_link = (data.get('links') or {}).get('next')
                 if next_link:
                     url = f"{self.api_url}{next_link}" # The link is relative, so add the base URL
                 else:
                     url = None # End the loop
 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 print(f"Error fetching targets: {e}", file=sys.stderr)
                 return None
         
@@ -109,7 +137,7 @@ class SnykAIBomAPIClient:
                     "attributes": {"target_id": target_id}
                 }
             }
-            response = requests.post(post_url, headers=self.headers, json=payload)
+            response = self.session.post(post_url, headers=self.headers, json=payload)
             
             # Some targets might not be compatible; we'll skip them.
             if response.status_code == 422: # Unprocessable Entity
@@ -117,7 +145,7 @@ class SnykAIBomAPIClient:
                  return []
 
             response.raise_for_status()
-            post_data = response.json()
+            post_data = _json.loads(response.content)
             logging.debug(f"  > Post data: {post_data}")
 
             job_url = f"{self.api_url}{post_data['links']['self']}" # The URL to poll
@@ -125,7 +153,7 @@ class SnykAIBomAPIClient:
             status = post_data['data']['attributes']['status']
             logging.debug(f"  > Job created. Initial status: {status}")
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logging.debug(f"  > Error creating job for '{target_name}': {e}", file=sys.stderr)
             return []
 
@@ -134,14 +162,14 @@ class SnykAIBomAPIClient:
             time.sleep(2) # Be kind to the API, wait before checking again
             try:
                 logging.debug(f"  > Requesting URL: {job_url}")
-                response = requests.get(job_url, headers=self.headers, params={'version': self.api_version}, allow_redirects=False)            
+                response = self.session.get(job_url, headers=self.headers, params={'version': self.api_version}, allow_redirects=False)            
                 response.raise_for_status()
-                response_data = response.json()
+                response_data = _json.loads(response.content)
                 logging.debug(f"  > Response data: {response_data}")
                 
                 status = response_data['data']['attributes']['status']
                 logging.debug(f"  > Polling... status is now: {status}")
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 logging.debug(f"  > Error polling job for '{target_name}': {e}", file=sys.stderr)
                 return []
 
@@ -155,12 +183,13 @@ class SnykAIBomAPIClient:
         # {self.api_url}/rest/orgs/{self.org_id}/ai_boms/{bom_id}?version={self.api_version}
         try:
             logging.debug(f"  > Requesting final BOM URL: {job_url}")
-            final_response = requests.get(job_url, headers=self.headers, params={'version': self.api_version}, allow_redirects=True)
+            final_response = self.session.get(job_url, headers=self.headers, params={'version': self.api_version}, allow_redirects=True)
             final_response.raise_for_status()
-            logging.debug(f"  > Final BOM response: {final_response.json()}")
+            final_data = _json.loads(final_response.content)
+            logging.debug(f"  > Final BOM response: {final_data}")
 
-            return final_response.json()
+            return final_data
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logging.debug(f"  > Error fetching final BOM for '{target_name}': {e}", file=sys.stderr)
             return []
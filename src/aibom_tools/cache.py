@@ -0,0 +1,92 @@
+"""
+On-disk cache of AI-BOM scan results for aibom-tools
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from . import __version__, _json
+
+# Cache location, following the XDG base directory convention
+CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "aibom-tools")
+
+# Age after which cached AI-BOMs are scanned again, even if the target is unchanged
+CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
+
+
+class ScanCache:
+    """
+    Stores the AI-BOM of each target in a SQLite database.
+
+    Entries are keyed by organization, target ID and the target's update time, along
+    with the tool and API versions so entries written by other versions are never reused.
+    The targets API exposes no commit or integration revision, and Snyk targets usually
+    only carry a created_at time, so new commits don't change the key. Cached AI-BOMs can
+    therefore be stale until they expire, which is why the cache is opt-in.
+    Cache errors are never fatal; an unreadable entry is treated as a miss and a failed
+    write is ignored.
+    """
+
+    def __init__(self, api_version: str, path: str = os.path.join(CACHE_DIR, "scan_cache.sqlite"),
+                 expire: int = CACHE_EXPIRE_SECONDS, refresh: bool = False):
+        self.api_version = api_version
+        self.expire = expire
+        self.refresh = refresh
+        # Scan workers share the connection, so access to it is serialized
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS scans (key TEXT PRIMARY KEY, created_at REAL NOT NULL, aibom_data BLOB NOT NULL)")
+            self._conn.execute("DELETE FROM scans WHERE created_at < ?", (time.time() - expire,))
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def key(self, target: dict) -> str:
+        """Get the cache key of a target"""
+        attributes = target.get('attributes') or {}
+        organization = ((target.get('relationships') or {}).get('organization') or {}).get('data') or {}
+        updated_at = attributes.get('updated_at') or attributes.get('created_at') or ''
+        return f"{__version__}:{self.api_version}:{organization.get('id', '')}:{target['id']}:{updated_at}"
+
+    def get(self, target: dict) -> Optional[dict]:
+        """Get the cached AI-BOM of a target, or None if it is missing, expired or being refreshed"""
+        if self.refresh or self._conn is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT aibom_data FROM scans WHERE key = ? AND created_at >= ?",
+                    (self.key(target), time.time() - self.expire),
+                ).fetchone()
+            return _json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(self, target: dict, aibom_data: dict) -> None:
+        """Store the AI-BOM of a target"""
+        if self._conn is None:
+            return
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO scans (key, created_at, aibom_data) VALUES (?, ?, ?)",
+                    (self.key(target), time.time(), _json.dumps(aibom_data)),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,23 +1,132 @@
+import gzip
+import os
 import sys
-import json
-import time
-from typing import Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, FrozenSet, Optional, TextIO
 
 import click
 import yaml
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.status import Status
 
+from . import _json
 from .config import Config
-from .api import SnykAIBomAPIClient
-from .utils.output import display_aibom_summary_all
-from .utils.html import generate_html_report
+from .api import POOL_SIZE, SnykAIBomAPIClient
+from .cache import ScanCache
+from .utils.components import normalize_model_name, parse_include_types
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 console = Console()
 
+# Write buffer for JSON and HTML output files
+OUTPUT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Compression level for HTML reports written to a .gz path. The markup is very repetitive,
+# so the fastest level already shrinks it several times over.
+HTML_GZIP_COMPRESSLEVEL = 1
+
+# Default number of targets scanned concurrently. Scanning is network-bound, so use a few
+# workers per CPU, capped to stay well within API rate limits.
+DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+# Redraw rate of the scan progress display
+PROGRESS_REFRESH_PER_SECOND = 4
+
+# Number of per-target status lines buffered before they are printed together
+STATUS_FLUSH_INTERVAL = 25
+
+# SCM integrations that support AI-BOM generation
+_SUPPORTED_INTEGRATIONS = frozenset({
+    'github',
+    'github-enterprise',
+    'github-cloud-app',
+    'github-server-app',
+    'gitlab',
+    'azure-repos',
+    'bitbucket-cloud',
+    'bitbucket-server',
+    'bitbucket-cloud-app',
+})
+
+# Location of a target's integration type in the targets API response
+_INTEGRATION_TYPE_PATH = ('relationships', 'integration', 'data', 'attributes', 'integration_type')
+
+
+def _integration_type(target: dict) -> Optional[str]:
+    """Get the integration type of a target, or None if it is missing"""
+    value: Any = target
+    for key in _INTEGRATION_TYPE_PATH:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, str) else None
+
+
+def _target_name(target: dict) -> str:
+    """Get the display name of a target"""
+    display_name: str = (target.get('attributes') or {}).get('display_name', 'Unknown Name')
+    return display_name
+
+
+def _scan_target(client: SnykAIBomAPIClient, cache: Optional[ScanCache], target: dict) -> Optional[dict]:
+    """Get the AI-BOM of a target, reusing its cached AI-BOM if caching is enabled"""
+    if cache:
+        cached_aibom_data = cache.get(target)
+        if cached_aibom_data:
+            return cached_aibom_data
+    
+    aibom_data: Optional[dict] = client.process_target(target)
+    if cache and aibom_data:
+        cache.set(target, aibom_data)
+    return aibom_data
+
+
+def _open_html_output(path: str) -> TextIO:
+    """Open the HTML report file for writing, gzip-compressing it if the path ends in .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=HTML_GZIP_COMPRESSLEVEL)
+    return open(path, 'w', encoding='utf-8', buffering=OUTPUT_WRITE_BUFFER_SIZE)
+
+
+class JsonOutputWriter:
+    """
+    Streams AI-BOM entries into a JSON output file as they are produced.
+    
+    Each entry is serialized and written on its own through a large write buffer,
+    so the full document is never materialized as a single bytes object. Closing
+    the writer terminates the document, leaving a valid file even if the scan is
+    interrupted part-way through. Output is compact unless pretty printing is
+    requested, in which case each entry is indented on its own lines.
+    """
+    
+    def __init__(self, output_path: str, pretty: bool = False):
+        self._file = open(output_path, 'wb', buffering=OUTPUT_WRITE_BUFFER_SIZE)
+        self._pretty = pretty
+        self._file.write(b'{"all_aibom_data": [' if pretty else b'{"all_aibom_data":[')
+        self._count = 0
+    
+    def write(self, entry: dict) -> None:
+        """Append a single entry to the all_aibom_data list"""
+        if self._count:
+            self._file.write(b',')
+        if self._pretty:
+            self._file.write(b'\n')
+        self._file.write(_json.dumps(entry, indent=self._pretty))
+        self._count += 1
+    
+    def close(self) -> None:
+        """Terminate the JSON document and close the file"""
+        if self._file.closed:
+            return
+        self._file.write(b'\n]}\n' if self._pretty else b']}\n')
+        self._file.close()
+
 
-def load_policy_file(policy_file_path: str) -> Set[str]:
+def load_policy_file(policy_file_path: str) -> FrozenSet[str]:
     """
     Load and parse a YAML policy file to extract rejected models.
     
@@ -31,8 +140,8 @@ def load_policy_file(policy_file_path: str) -> Set[str]:
         click.ClickException: If the policy file cannot be parsed or is invalid
     """
     try:
-        with open(policy_file_path, 'r') as f:
-            policy_data = yaml.safe_load(f)
+        with open(policy_file_path, 'rb') as f:
+            policy_data = yaml.load(f, Loader=_YamlLoader)
         
         if not isinstance(policy_data, dict):
             raise click.ClickException(f"Policy file must contain a YAML dictionary, got {type(policy_data)}")
@@ -49,9 +158,9 @@ def load_policy_file(policy_file_path: str) -> Set[str]:
         for model in reject_list:
             if not isinstance(model, str):
                 raise click.ClickException(f"All rejected models must be strings, got {type(model)}")
-            rejected_models.add(model.strip().lower())
+            rejected_models.add(normalize_model_name(model))
         
-        return rejected_models
+        return frozenset(rejected_models)
         
     except yaml.YAMLError as e:
         raise click.ClickException(f"Failed to parse YAML policy file: {e}")
@@ -128,10 +237,15 @@ def cli(ctx: click.Context, api_token: Optional[str], org_id: Optional[str], gro
     type=click.Path(),
     help="Output file path for AI-BOMs",
 )
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the JSON output file for readability",
+)
 @click.option(
     "--html",
     type=click.Path(),
-    help="Output file path for HTML report",
+    help="Output file path for HTML report (gzip-compressed if the path ends in .gz)",
 )
 @click.option(
     "--include",
@@ -150,20 +264,55 @@ def cli(ctx: click.Context, api_token: Optional[str], org_id: Optional[str], gro
     default='component',
     help="Group output by 'component' (default) or 'repo'",
 )
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Only print the total number of AI components instead of the summary tables",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of targets to scan concurrently",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse AI-BOMs cached by earlier scans; they can miss commits made since they were cached",
+)
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Scan every target and replace its cached AI-BOM",
+)
 @click.pass_context
 def scan(
     ctx: click.Context,
     output: Optional[str],
+    pretty: bool,
     html: Optional[str],
     include: Optional[str],
     policy_file: Optional[str],
     group_by: str,
+    quiet: bool,
+    concurrency: int,
+    use_cache: bool,
+    refresh_cache: bool,
 ) -> None:
     """
     Create a new AI-BOM scan
     
     This command triggers a scan of all targets in the given Snyk organization.
     """
+    # Imported here so that --help and --version don't pay for loading the Rich widgets and reports
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.status import Status
+    
+    from .utils.output import display_aibom_summary_all, display_aibom_total
+    from .utils.html import write_html_report
 
     config = ctx.obj["config"]
     
@@ -177,6 +326,15 @@ def scan(
             console.print(f"[bold red]Error:[/bold red] {e}")
             sys.exit(1)
     
+    # Resolve the component types to include once, for both the console summary and the HTML report
+    included_types, unknown_types = parse_include_types(include)
+    for user_type in unknown_types:
+        console.print(f"[bold yellow]Warning:[/bold yellow] Unknown component type '{user_type}' will be ignored")
+    
+    if included_types is not None and not included_types:
+        console.print("[bold red]Error:[/bold red] No valid component types specified")
+        sys.exit(1)
+    
     # Validate required configuration
     if not config.api_token:
         console.print("[bold red]Error:[/bold red] API token is required. "
@@ -190,11 +348,13 @@ def scan(
     
     # Create API client
     # client = SnykAIBOMClient(config)
-    client = SnykAIBomAPIClient(config)
+    client = SnykAIBomAPIClient(config, pool_size=max(concurrency, POOL_SIZE))
+    cache = ScanCache(config.api_version, refresh=refresh_cache) if use_cache or refresh_cache else None
+    json_writer = None
     try:
         # Animated status while retrieving targets
         with Status("[bold green]Retrieving targets...", spinner="dots") as status:
-            all_targets = client.get_all_targets()
+            all_targets = client.get_all_targets(concurrency=concurrency)
             all_aiboms = []
             
         if not all_targets:
@@ -206,71 +366,104 @@ def scan(
         else:
             console.print(f"[bold blue]🎯 Found {len(all_targets)} total targets in the organization {config.org_id}.[/bold blue]")
         
-        # Filter targets to only supported ones for the progress bar
-        supported_targets = []
-        for target in all_targets:
-            integration_type = target.get('relationships', {}).get('integration', {}).get('data', {}).get('attributes', {}).get('integration_type')
-            if integration_type in ['github', 'github-enterprise', 'github-cloud-app', 'github-server-app', 'gitlab', 'azure-repos', 'bitbucket-cloud', 'bitbucket-server', 'bitbucket-cloud-app']:
-                supported_targets.append(target)
+        # Filter targets to only supported ones for the progress bar, looking up each integration type once.
+        # Other target types like container images or manual uploads are skipped.
+        target_integrations = [(target, _integration_type(target)) for target in all_targets]
+        supported_targets = [target for target, integration in target_integrations if integration in _SUPPORTED_INTEGRATIONS]
+        skipped_count = len(all_targets) - len(supported_targets)
+        if skipped_count:
+            # Large orgs can have thousands of unsupported targets, so only name them when debugging
+            if config.debug:
+                console.print("\n".join(
+                    f"  [dim]⏭️  Skipping {_target_name(target)} (unsupported type)[/dim]"
+                    for target, integration in target_integrations if integration not in _SUPPORTED_INTEGRATIONS
+                ))
+            console.print(f"[dim]⏭️  Skipped {skipped_count} unsupported targets[/dim]")
         
         console.print(f"[bold cyan]📊 Processing {len(supported_targets)} supported targets...[/bold cyan]")
         
+        # Stream AI-BOMs to the JSON output as they arrive rather than dumping them all at the end
+        if output:
+            json_writer = JsonOutputWriter(output, pretty=pretty)
+        
         # Progress bar for processing targets
         with Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console
+            console=console,
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND
         ) as progress:
             
-            main_task = progress.add_task("Scanning targets...", total=len(all_targets))
+            main_task = progress.add_task("Scanning targets...", total=len(supported_targets))
             
-            for i, target in enumerate(all_targets):
-                target_name = target['attributes'].get('display_name', 'Unknown Name')
-                progress.update(main_task, description=f"Processing: {target_name[:30]}...")
-                
-                integration_type = target.get('relationships', {}).get('integration', {}).get('data', {}).get('attributes', {}).get('integration_type')
-                if integration_type in ['github', 'github-enterprise', 'github-cloud-app', 'github-server-app', 'gitlab', 'azure-repos', 'bitbucket-cloud', 'bitbucket-server', 'bitbucket-cloud-app']:
-                    aibom_data = client.process_target(target)
-                    if aibom_data:
-                        component_count = len(aibom_data['data']['attributes']['components']) - 1
-                        console.print(f"  [bold green]✅[/bold green] {target_name}: [bold yellow]{component_count}[/bold yellow] AI components")
-                        all_aiboms.append({ 
-                            'target_name': target_name,
-                            'aibom_data': aibom_data
-                        })
-                    else:
-                        console.print(f"  [bold red]❌[/bold red] Error scanning {target_name}")
-                else:
-                    # Skip other target types like container images or manual uploads
-                    console.print(f"  [dim]⏭️  Skipping {target_name} (unsupported type)[/dim]")
+            # Each target is an independent, network-bound AI-BOM job, so run them concurrently.
+            # Results are consumed on this thread in submission order, so the JSON output and
+            # reports keep the order of the targets, and progress and console updates stay
+            # serialized. Status lines are buffered and the description is only updated when
+            # it changes, so the live display is not re-rendered for every single target.
+            status_lines = []
+            last_description = None
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [(executor.submit(_scan_target, client, cache, target), _target_name(target)) for target in supported_targets]
                 
-                progress.advance(main_task)
-        
-        # Animated completion message
-        with console.status("[bold green]Generating comprehensive report...", spinner="arc"):
-            time.sleep(1)  # Simulate processing time
+                try:
+                    for future, target_name in futures:
+                        description = f"Processing: {target_name[:30]}..."
+                        if description != last_description:
+                            progress.update(main_task, description=description)
+                            last_description = description
+                        
+                        aibom_data = future.result()
+                        if aibom_data:
+                            component_count = len(aibom_data['data']['attributes']['components']) - 1
+                            status_lines.append(f"  [bold green]✅[/bold green] {target_name}: [bold yellow]{component_count}[/bold yellow] AI components")
+                            entry = {
+                                'target_name': target_name,
+                                'aibom_data': aibom_data
+                            }
+                            all_aiboms.append(entry)
+                            if json_writer:
+                                json_writer.write(entry)
+                        else:
+                            status_lines.append(f"  [bold red]❌[/bold red] Error scanning {target_name}")
+                        
+                        if len(status_lines) >= STATUS_FLUSH_INTERVAL:
+                            console.print("\n".join(status_lines))
+                            status_lines.clear()
+                        
+                        progress.advance(main_task)
+                except BaseException:
+                    # Don't let the executor run every queued target on the way out after an error or Ctrl-C
+                    for future, _ in futures:
+                        future.cancel()
+                    raise
+            
+            if status_lines:
+                console.print("\n".join(status_lines))
         
         console.print("\n[bold green]🎉 Scan Complete![/bold green]")
         console.print("[bold blue]" + "=" * 50 + "[/bold blue]")
         
-        # Display comprehensive summary of all AI components
-        if all_aiboms:
-            display_aibom_summary_all(all_aiboms, include_types=include, rejected_models=rejected_models, group_by=group_by)
+        # Display comprehensive summary of all AI components. The tables are skipped when asked to,
+        # or when the results are going to files and nobody is watching the terminal.
+        summary_only = quiet or (not sys.stdout.isatty() and bool(output or html))
+        if all_aiboms and summary_only:
+            display_aibom_total(all_aiboms, included_types=included_types, rejected_models=rejected_models)
+        elif all_aiboms:
+            display_aibom_summary_all(all_aiboms, included_types=included_types, rejected_models=rejected_models, group_by=group_by)
         else:
             console.print("[bold yellow]⚠️  No AI components found in any targets.[/bold yellow]")
 
-        if output:
-            output_data = {"all_aibom_data": all_aiboms}
-            with open(output, 'w') as f:
-                json.dump(output_data, f, indent=4)
+        if json_writer:
+            json_writer.close()
             console.print(f"[bold green]📄 JSON report saved to: {output}[/bold green]")
         
         if html:
-            html_content = generate_html_report(all_aiboms, include_types=include, rejected_models=rejected_models, group_by=group_by)
-            with open(html, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with console.status("[bold green]Generating HTML report...", spinner="arc"):
+                with _open_html_output(html) as f:
+                    write_html_report(f, all_aiboms, included_types=included_types, rejected_models=rejected_models, group_by=group_by)
             console.print(f"[bold green]🌐 HTML report saved to: {html}[/bold green]")
             
     except Exception as e:
@@ -278,6 +471,12 @@ def scan(
         if config.debug:
             console.print_exception()
         sys.exit(1)
+    finally:
+        if json_writer:
+            json_writer.close()
+        if cache:
+            cache.close()
+        client.close()
 
 
 def main() -> None:
@@ -0,0 +1,171 @@
+from functools import lru_cache
+from itertools import islice
+from typing import AbstractSet, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Mapping from user-friendly component type names to internal types (case-insensitive)
+USER_TYPE_MAPPING = {
+    'ml model': 'machine-learning-model',
+    'ml models': 'machine-learning-model',
+    'machine learning model': 'machine-learning-model',
+    'machine learning models': 'machine-learning-model',
+    'dataset': 'data',
+    'datasets': 'data',
+    'data': 'data',
+    'library': 'library',
+    'libraries': 'library',
+    'application': 'application',
+    'applications': 'application',
+    'app': 'application',
+    'apps': 'application'
+}
+
+# Internal component types, also accepted directly for backward compatibility
+INTERNAL_TYPES = frozenset(['machine-learning-model', 'data', 'library', 'application'])
+
+# Component types checked against the policy file's rejected models
+POLICY_TYPES = frozenset(['machine-learning-model'])
+
+# Readable names for internal component types
+DISPLAY_TYPE_MAPPING = {
+    'machine-learning-model': 'ML Model',
+    'data': 'Dataset',
+    'library': 'Library',
+    'application': 'Application'
+}
+
+
+class ComponentRow(NamedTuple):
+    """A single AI component as shown in the summary tables"""
+    name: str
+    target_name: str
+    type: str
+    locations: str
+
+
+def parse_include_types(include_types: Optional[str]) -> Tuple[Optional[FrozenSet[str]], List[str]]:
+    """
+    Parse a comma-separated list of component types into internal types.
+
+    Returns:
+        Tuple of the set of internal types (None if no filter was given) and
+        the list of names that could not be recognized.
+    """
+    if not include_types:
+        return None, []
+
+    included_internal_types = set()
+    unknown_types = []
+
+    for user_type in (t.strip().lower() for t in include_types.split(',')):
+        if user_type in USER_TYPE_MAPPING:
+            included_internal_types.add(USER_TYPE_MAPPING[user_type])
+        elif user_type in INTERNAL_TYPES:
+            included_internal_types.add(user_type)
+        else:
+            unknown_types.append(user_type)
+
+    return frozenset(included_internal_types), unknown_types
+
+
+@lru_cache(maxsize=64)
+def format_component_type(comp_type: str) -> str:
+    """Get the readable name of an internal component type, e.g. 'ML Model' for 'machine-learning-model'"""
+    return DISPLAY_TYPE_MAPPING.get(comp_type) or comp_type.title()
+
+
+def normalize_model_name(name: str) -> str:
+    """Normalize a model name for matching against the policy file's rejected models"""
+    return name.strip().lower()
+
+
+def is_included_type(comp_type: str, included_types: Optional[FrozenSet[str]]) -> bool:
+    """Check whether a component type passes the include filter, where None includes all types"""
+    return not included_types or comp_type in included_types
+
+
+def is_rejected_model(component: dict, rejected_models: AbstractSet[str]) -> bool:
+    """Check whether a component is an ML model that the policy rejects"""
+    # Only ML models are checked for policy violations
+    return component.get('type') in POLICY_TYPES and normalize_model_name(component.get('name', '')) in rejected_models
+
+
+def iter_components(aibom_data: dict) -> Iterator[dict]:
+    """
+    Iterate over the AI components of an AI-BOM.
+
+    Handles both the old format (data.attributes.components) and the new format
+    (components), and skips the Root application component as it's not a real
+    AI component.
+    """
+    if 'data' in aibom_data:
+        components = ((aibom_data['data'] or {}).get('attributes') or {}).get('components')
+    else:
+        components = aibom_data.get('components')
+
+    for component in components or ():
+        if component.get('type') == 'application' and component.get('name') == 'Root':
+            continue
+        yield component
+
+
+def iter_ai_components(all_aiboms: Iterable[dict], included_types: Optional[FrozenSet[str]] = None) -> Iterator[Tuple[str, dict]]:
+    """
+    Iterate over the AI components of all scanned targets as (target name, component) pairs.
+
+    Args:
+        all_aiboms: Scanned targets, each with a target_name and its aibom_data
+        included_types: Internal component types to include, or None to include all types
+    """
+    for target_info in all_aiboms:
+        target_name = target_info.get('target_name', 'Unknown Target')
+        for component in iter_components(target_info.get('aibom_data') or {}):
+            if not is_included_type(component.get('type', 'unknown'), included_types):
+                continue
+            yield target_name, component
+
+
+def iter_rejected_models(all_aiboms: Iterable[dict], rejected_models: AbstractSet[str]) -> Iterator[Tuple[str, dict]]:
+    """
+    Iterate over the ML models of all scanned targets that the policy rejects, as
+    (target name, component) pairs.
+
+    Args:
+        all_aiboms: Scanned targets, each with a target_name and its aibom_data
+        rejected_models: Normalized names of the rejected models
+    """
+    for target_name, component in iter_ai_components(all_aiboms, POLICY_TYPES):
+        if is_rejected_model(component, rejected_models):
+            yield target_name, component
+
+
+def _format_occurrence(occurrence: dict) -> str:
+    """Format a single evidence occurrence, which must have a location, as 'location:line'"""
+    location = occurrence['location']
+    line = occurrence.get('line')
+    return f"{location}:{line}" if line else location
+
+
+def format_locations(occurrences: Iterable[dict], limit: int, separator: str, more_separator: str) -> str:
+    """
+    Format evidence occurrences for display.
+
+    Args:
+        occurrences: Evidence occurrences of a component
+        limit: Maximum number of locations to show
+        separator: Separator between locations
+        more_separator: Separator before the '... and N more' suffix
+
+    Returns:
+        The formatted locations, or "No source locations" if there are none
+    """
+    # Only the shown locations are formatted; the rest just need counting
+    located = (occurrence for occurrence in occurrences if occurrence.get('location'))
+    shown = [_format_occurrence(occurrence) for occurrence in islice(located, limit)]
+    if not shown:
+        return "No source locations"
+
+    location_str = separator.join(shown)
+    remaining = sum(1 for _ in located)
+    if remaining:
+        location_str += f"{more_separator}... and {remaining} more"
+    return location_str
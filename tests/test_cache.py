@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from aibom_tools.cache import ScanCache
+
+TARGET = {
+    'id': 'target-1',
+    'attributes': {'display_name': 'org/repo', 'created_at': '2024-01-01T00:00:00Z'},
+    'relationships': {'organization': {'data': {'id': 'org-1'}}},
+}
+
+AIBOM = {'data': {'attributes': {'components': [{'name': 'gpt-4', 'type': 'machine-learning-model'}]}}}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "scan_cache.sqlite")
+
+
+def test_miss(cache_path):
+    cache = ScanCache("2024-10-15", path=cache_path)
+    assert cache.get(TARGET) is None
+    cache.close()
+
+
+def test_hit(cache_path):
+    cache = ScanCache("2024-10-15", path=cache_path)
+    cache.set(TARGET, AIBOM)
+    assert cache.get(TARGET) == AIBOM
+    cache.close()
+
+    # Entries are persisted across runs
+    cache = ScanCache("2024-10-15", path=cache_path)
+    assert cache.get(TARGET) == AIBOM
+    cache.close()
+
+
+def test_other_api_version_misses(cache_path):
+    cache = ScanCache("2024-10-15", path=cache_path)
+    cache.set(TARGET, AIBOM)
+    cache.close()
+
+    cache = ScanCache("2025-01-01", path=cache_path)
+    assert cache.get(TARGET) is None
+    cache.close()
+
+
+def test_expiry(cache_path, monkeypatch):
+    cache = ScanCache("2024-10-15", path=cache_path, expire=60)
+    cache.set(TARGET, AIBOM)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get(TARGET) is None
+    cache.close()
+
+
+def test_refresh(cache_path):
+    cache = ScanCache("2024-10-15", path=cache_path)
+    cache.set(TARGET, AIBOM)
+    cache.close()
+
+    # A refreshing cache ignores existing entries, but replaces them
+    refreshed = {'data': {'attributes': {'components': []}}}
+    cache = ScanCache("2024-10-15", path=cache_path, refresh=True)
+    assert cache.get(TARGET) is None
+    cache.set(TARGET, refreshed)
+    cache.close()
+
+    cache = ScanCache("2024-10-15", path=cache_path)
+    assert cache.get(TARGET) == refreshed
+    cache.close()
+
+
+def test_unusable_path_disables_cache(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache = ScanCache("2024-10-15", path=str(blocker / "scan_cache.sqlite"))
+    cache.set(TARGET, AIBOM)
+    assert cache.get(TARGET) is None
+    cache.close()